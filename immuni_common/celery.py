@@ -12,6 +12,7 @@
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
 from logging import Logger
 from types import ModuleType
 from typing import Any, Callable, Dict, ItemsView, Iterable, Optional, Union
@@ -25,18 +26,28 @@ from prometheus_client.exposition import start_http_server
 
 from immuni_common.core import config
 from immuni_common.helpers.logging import setup_celery_logger
-from immuni_common.helpers.utils import dense_dict, modules_in_package
+from immuni_common.helpers.utils import modules_in_package
 from immuni_common.monitoring.core import initialize_monitoring
 
 
+@lru_cache(maxsize=None)
 def string_to_crontab(crontab_string: str) -> crontab:
     """
     Parse a crontab string into a crontab object.
+    The result is memoized, since the same crontab string is typically parsed multiple times when
+    building the different schedules.
 
     :param crontab_string: the crontab string to parse.
     :return: the parsed crontab object.
     """
-    return crontab(*[",".join(map(str, x)) for x in croniter(crontab_string).expanded])
+    expanded = croniter(crontab_string).expanded
+    return crontab(
+        ",".join(map(str, expanded[0])),
+        ",".join(map(str, expanded[1])),
+        ",".join(map(str, expanded[2])),
+        ",".join(map(str, expanded[3])),
+        ",".join(map(str, expanded[4])),
+    )
 
 
 @dataclass(frozen=True)
@@ -55,11 +66,10 @@ class Schedule:
 
         :return: the items view of the different schedules in a format suitable for Celery.
         """
-        return {
-            self.task.name: dense_dict(
-                dict(task=self.task.name, schedule=self.when, kwargs=self.with_params)
-            )
-        }.items()
+        schedule_dict = dict(task=self.task.name, schedule=self.when)
+        if self.with_params is not None:
+            schedule_dict["kwargs"] = self.with_params
+        return {self.task.name: schedule_dict}.items()
 
 
 def _overall_schedule(*schedules: Schedule) -> Dict[Any, Any]:
@@ -103,6 +113,11 @@ class CeleryApp(Celery):
 
         super().__init__(__name__, broker=broker_redis_url)
         self.conf.enable_utc = True
+        # Reuse broker connections instead of re-establishing them per publish.
+        self.conf.broker_pool_limit = config.CELERY_BROKER_POOL_LIMIT
+        # Keep the pooled broker sockets alive instead of letting idle ones be torn down and
+        # re-handshaked; the visibility timeout matches the longest-running tasks.
+        self.conf.broker_transport_options = dict(socket_keepalive=True, visibility_timeout=3600)
         self.conf.worker_max_tasks_per_child = 100  # to keep workers relatively fresh
         self.conf.worker_send_task_events = True
         self.conf.task_send_sent_event = True
@@ -112,6 +127,7 @@ class CeleryApp(Celery):
         self.__service_dir_name__ = service_dir_name
         self.__schedules_function = schedules_function
         self.__routes_function = routes_function
+        self.__beat_schedule: Optional[Dict[Any, Any]] = None
 
         self.on_after_configure.connect(self._after_configure)
 
@@ -126,7 +142,11 @@ class CeleryApp(Celery):
         started.
         """
         if self.__schedules_function:
-            self.conf.beat_schedule = _overall_schedule(*self.__schedules_function())
+            # NOTE: The signal may fire more than once (e.g., when the configuration is touched
+            #  again after startup): compute the overall schedule only the first time.
+            if self.__beat_schedule is None:
+                self.__beat_schedule = _overall_schedule(*self.__schedules_function())
+            self.conf.beat_schedule = self.__beat_schedule
         if self.__routes_function:
             self.conf.task_routes = self.__routes_function()
 
@@ -32,6 +32,7 @@ API_HOST: str = config("API_HOST", default="0.0.0.0")
 API_PORT: int = config("API_PORT", default="5000", cast=int)
 
 CELERY_PROMETHEUS_PORT: int = config("CELERY_PROMETHEUS_PORT", default=6666, cast=int)
+CELERY_BROKER_POOL_LIMIT: int = config("CELERY_BROKER_POOL_LIMIT", default=10, cast=int)
 
 CACHE_ENABLED: bool = config("CACHE_ENABLED", cast=bool, default=True)
 
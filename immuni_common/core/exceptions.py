@@ -11,7 +11,9 @@
 #  You should have received a copy of the GNU Affero General Public License
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import json
 from http import HTTPStatus
+from typing import ClassVar, Dict
 
 
 class ImmuniException(Exception):
@@ -32,6 +34,25 @@ class ApiException(ImmuniException):
     error_message = "An unknown error occurred."
     error_code = 1000
 
+    # NOTE: Shared across subclasses on purpose, keyed by class.
+    _cached_bodies: ClassVar[Dict[type, bytes]] = {}
+
+    @classmethod
+    def cached_body(cls) -> bytes:
+        """
+        Return the serialized JSON error body for this exception class.
+        NOTE: The body only depends on class attributes, so it is serialized once per class and
+          reused for every subsequent error response.
+
+        :return: the serialized JSON error body.
+        """
+        if (body := cls._cached_bodies.get(cls)) is None:
+            body = cls._cached_bodies[cls] = json.dumps(
+                {"error_code": cls.error_code, "message": cls.error_message},
+                separators=(",", ":"),
+            ).encode()
+        return body
+
 
 class SchemaValidationException(ApiException):
     """
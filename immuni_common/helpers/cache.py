@@ -48,11 +48,7 @@ def cache(max_age: Optional[timedelta] = None, no_store: Optional[bool] = None)
             if _CACHE_CONTROL in response.headers:
                 raise ImmuniException(f"Attempt to redefine {_CACHE_CONTROL} headers.")
 
-            # NOTE: Check for both defined or both undefined has already been done outside.
-            if max_age:
-                response.headers[_CACHE_CONTROL] = f"public, max-age={int(max_age.total_seconds())}"
-            if no_store:
-                response.headers[_CACHE_CONTROL] = "no-store"
+            response.headers[_CACHE_CONTROL] = header_value
 
             return response
 
@@ -64,4 +60,10 @@ def cache(max_age: Optional[timedelta] = None, no_store: Optional[bool] = None)
             f"be defined (max_age: {max_age}, no_store: {no_store})."
         )
 
+    # NOTE: Computed once at decoration time, the value being immutable afterwards.
+    if no_store:
+        header_value = "no-store"
+    else:
+        header_value = f"public, max-age={int(max_age.total_seconds())}"  # type: ignore
+
     return _decorator
@@ -15,6 +15,7 @@ import base64
 import binascii
 import logging
 import pathlib
+from functools import lru_cache
 from typing import Callable
 
 from croniter import croniter
@@ -24,6 +25,18 @@ from immuni_common.core.exceptions import ImmuniException
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _is_valid_crontab(value: str) -> bool:
+    """
+    Assess whether the given string is a valid crontab string, memoizing the result since the same
+    crontab string may be validated by multiple configurations.
+
+    :param value: the crontab string to validate.
+    :return: True if the crontab string is valid, False otherwise.
+    """
+    return croniter.is_valid(value)
+
+
 def load_certificate(config_name: str) -> Callable[[str], str]:
     """
     Return a callback to load a certificate from the given config.
@@ -33,13 +46,17 @@ def load_certificate(config_name: str) -> Callable[[str], str]:
     :return: the callback to actually load the certificate from the given config.
     """
 
+    @lru_cache(maxsize=1)
     def _load_certificate_value(config_content: str) -> str:
         is_base64 = False
         try:
+            # NOTE: is_file may raise OSError too (e.g., the content is too long to be a path).
             is_file = (path := pathlib.Path(config_content)).is_file()
-            certificate = path.read_text()
-        except (OSError, FileNotFoundError):
+        except OSError:
             is_file = False
+        if is_file:
+            certificate = path.read_text()
+        else:
             try:
                 certificate = base64.b64decode(config_content).decode("utf-8")
                 is_base64 = True
@@ -66,7 +83,7 @@ def validate_crontab(config_name: str) -> Callable[[str], str]:
     """
 
     def _validate_crontab(value: str) -> str:
-        if not croniter.is_valid(value):
+        if not _is_valid_crontab(value):
             raise ImmuniException(f"Invalid crontab string for {config_name}: {value}.")
         return value
 
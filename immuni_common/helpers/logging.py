@@ -11,9 +11,11 @@
 #  You should have received a copy of the GNU Affero General Public License
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import json
 import logging
 import re
 import sys
+from functools import partial
 from typing import Any, Dict, Optional, Set
 
 from gunicorn import glogging
@@ -23,6 +25,9 @@ from sanic.log import LOGGING_CONFIG_DEFAULTS
 
 from immuni_common.models.enums import LogLevel
 
+# Compact separators shave serialization time and bytes off every log record.
+_COMPACT_JSON_SERIALIZER = partial(json.dumps, separators=(",", ":"))
+
 
 class RedactingJsonFormatter(jsonlogger.JsonFormatter):
     """
@@ -51,6 +56,16 @@ class RedactingJsonFormatter(jsonlogger.JsonFormatter):
     _REDACT_PATTERNS = [
         r"(?:[0-9]{1,3}\.){3}[0-9]{1,3}",  # Any IP (simple regex, allows numbers > 255 too).
     ]
+    # NOTE: Compiled once here into a single alternation, since format runs for every log record
+    #  and scanning the message once is cheaper than once per pattern.
+    _REDACT_REGEX = re.compile("|".join(_REDACT_PATTERNS))
+    # All of the redaction patterns require at least a digit: messages without digits can skip
+    # the (more expensive) substitution altogether. The disjointness check runs entirely in C,
+    # without any of the regex engine's per-call machinery.
+    _DIGITS = frozenset("0123456789")
+
+    # The format string for the default attributes, computed once instead of per instantiation.
+    _DEFAULT_FMT = " ".join(sorted(_LOGGING_ATTRS))
 
     def __init__(
         self, json_indent: Optional[int], logging_attrs: Optional[Set[str]] = None
@@ -60,20 +75,22 @@ class RedactingJsonFormatter(jsonlogger.JsonFormatter):
         :param logging_attrs: the attributes to log, in addition to the default ones.
         """
         super().__init__(
-            fmt=" ".join(
+            fmt=self._DEFAULT_FMT
+            if not logging_attrs
+            else " ".join(
                 sorted(
                     self._LOGGING_ATTRS.union(
-                        set(
-                            attr
-                            for attr in logging_attrs or set()
-                            if all(reserved not in attr for reserved in self._RESERVED_ATTRS)
-                        )
+                        attr
+                        for attr in logging_attrs
+                        if all(reserved not in attr for reserved in self._RESERVED_ATTRS)
                     )
                 )
             ),
             reserved_attrs={*RESERVED_ATTRS, *self._RESERVED_ATTRS},
             json_indent=json_indent if json_indent else None,
         )
+        if not json_indent:
+            self.json_serializer = _COMPACT_JSON_SERIALIZER
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -83,9 +100,9 @@ class RedactingJsonFormatter(jsonlogger.JsonFormatter):
         :return: the formatted and redacted log record, as string.
         """
         message = super().format(record)
-        for pattern in self._REDACT_PATTERNS:
-            message = re.sub(pattern, "***", message)
-        return message
+        if self._DIGITS.isdisjoint(message):
+            return message
+        return self._REDACT_REGEX.sub("***", message)
 
 
 class CustomGunicornLogger(glogging.Logger):
@@ -105,20 +122,28 @@ class CustomGunicornLogger(glogging.Logger):
         self._set_handler(self.access_log, cfg.accesslog, RedactingJsonFormatter(json_indent=None))
 
 
+_ROOT_HANDLER: Optional[logging.StreamHandler] = None
+
+
 def initialize_logging(log_level: LogLevel, log_json_indent: int) -> None:
     """
     Initialize logging and set proper default levels and formatters.
+    Idempotent: calling it again only updates the levels, avoiding both duplicate handlers and
+    the cost of formatting (and redacting) every record more than once.
 
     :param log_level: the log level to set.
     :param log_json_indent: the log json indentation.
     """
+    global _ROOT_HANDLER  # pylint: disable=global-statement
+
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level.name)
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(log_level.name)
-    handler.setFormatter(RedactingJsonFormatter(json_indent=log_json_indent))
-    root_logger.addHandler(handler)
+    if _ROOT_HANDLER is None:
+        _ROOT_HANDLER = logging.StreamHandler(sys.stdout)
+        _ROOT_HANDLER.setFormatter(RedactingJsonFormatter(json_indent=log_json_indent))
+        root_logger.addHandler(_ROOT_HANDLER)
+    _ROOT_HANDLER.setLevel(log_level.name)
 
 
 def get_sanic_logger_config(log_json_indent: int) -> Dict[str, Any]:
@@ -18,7 +18,7 @@ from collections.abc import Iterable
 from datetime import date, datetime
 from functools import wraps
 from http import HTTPStatus
-from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, ClassVar, Coroutine, Dict, List, Optional, Union
 
 from marshmallow import Schema, ValidationError
 from marshmallow.fields import Field
@@ -28,15 +28,15 @@ from sanic_openapi import doc
 
 from immuni_common.core import config
 from immuni_common.core.exceptions import ApiException, ImmuniException, SchemaValidationException
-from immuni_common.helpers.utils import WeightedPayload, weighted_random
+from immuni_common.helpers.utils import WeightedPayload, weighted_sampler
 from immuni_common.models.enums import Location
 from immuni_common.models.marshmallow.fields import IntegerBoolField
 from immuni_common.models.swagger import HeaderImmuniDummyData
 
-_ALLOWED_JSON_CONTENT_TYPES = {
-    "application/json; charset=utf-8",
-    "application/json",
-}
+# The canonical JSON content type, shared by the response default and the request validation.
+_JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+
+_ALLOWED_JSON_CONTENT_TYPES = frozenset({_JSON_CONTENT_TYPE, "application/json",})
 
 
 class Serializable:
@@ -45,6 +45,9 @@ class Serializable:
     All subclasses can be serialized with the CustomJSONEncoder.
     """
 
+    # No state of its own: do not force a per-instance dict onto slotted subclasses.
+    __slots__ = ()
+
     def serialize(self) -> Dict[str, Any]:
         """
         Abstract method to serialize the class instance.
@@ -60,6 +63,16 @@ class CustomJSONEncoder(json.JSONEncoder):
     JSON encoder class to serialize objects not serializable with the default JSON serializer.
     """
 
+    # NOTE: Exact-type dispatch for the common cases; one dict lookup replaces the isinstance
+    #  chain below, which stays as the fallback for subclasses and arbitrary iterables.
+    _DISPATCH: ClassVar[Dict[type, Callable[[Any], Any]]] = {
+        date: date.isoformat,
+        datetime: datetime.isoformat,
+        set: list,
+        frozenset: list,
+        tuple: list,
+    }
+
     def default(self, o: Any) -> Any:
         """
         Default serialization of this encoder.
@@ -67,20 +80,28 @@ class CustomJSONEncoder(json.JSONEncoder):
         :param o: the object to be serialized.
         :return: the serialized object.
         """
+        if (transform := self._DISPATCH.get(o.__class__)) is not None:
+            return transform(o)
         if isinstance(o, Serializable):
             return o.serialize()
         if isinstance(o, (date, datetime)):
             return o.isoformat()
-        if isinstance(o, Iterable):
+        # Concrete-type check first: the Iterable ABC's __instancecheck__ is considerably slower.
+        if isinstance(o, (set, frozenset, tuple)) or isinstance(o, Iterable):
             return list(o)
         return super().default(o)
 
 
+# NOTE: A single reusable encoder instance: json.dumps with cls= instantiates the encoder class
+#  on every call, while compact separators avoid needless spacing in the payloads.
+_JSON_ENCODER = CustomJSONEncoder(separators=(",", ":"))
+
+
 def json_response(
     body: Any,
     status: HTTPStatus = HTTPStatus.OK,
     headers: Optional[Dict] = None,
-    content_type: str = "application/json; charset=utf-8",
+    content_type: str = _JSON_CONTENT_TYPE,
 ) -> HTTPResponse:
     """
     Compute a JSON response from the input arguments.
@@ -92,7 +113,7 @@ def json_response(
     :return: the resulting HTTPResponse object.
     """
     return HTTPResponse(
-        body="" if body is None else json.dumps(body, cls=CustomJSONEncoder),
+        body="" if body is None else _JSON_ENCODER.encode(body),
         status=status.value,
         headers=headers,
         content_type=content_type,
@@ -114,29 +135,15 @@ def validate(*, location: Location, **fields: Union[Field, type],) -> Callable:
     def _decorator(
         f: Callable[..., Awaitable[HTTPResponse]]
     ) -> Callable[..., Awaitable[HTTPResponse]]:
-        @wraps(f)
-        async def _wrapper(request: Request, *args: Any, **kwargs: Any) -> HTTPResponse:
-            data = getattr(request, location.value, {})
-            if location == Location.HEADERS:
-                data = _remap_data_keys(data)
-            elif location == Location.QUERY:
-                _validate_query_args_length(data)
-            elif location == Location.JSON:
-                _validate_json_content_type(request)
-            schema = Schema.from_dict(fields)
-            try:
-                valid_data = schema().load(data)  # pylint: disable=no-member
-            except ValidationError as exc:
-                raise SchemaValidationException(exc.messages) from exc
-
-            if intersection := set(kwargs.keys()).intersection(set(valid_data.keys())):
-                raise ImmuniException(
-                    f"Trying to validate some fields more than once: {list(intersection)}."
-                )
-
-            kwargs.update(**valid_data)
-
-            return await f(request, *args, **kwargs)
+        # NOTE: Built once at decoration time; rebuilding the Schema class on every request is
+        #  by far the most expensive part of the validation.
+        schema = Schema.from_dict(fields)()
+
+        # The header keys to look up, resolved once instead of per request.
+        header_lookup_keys = tuple(
+            field.data_key if isinstance(field, Field) and field.data_key else field_key
+            for field_key, field in fields.items()
+        )
 
         def _remap_data_keys(data: Dict[str, Any]) -> Dict[str, Any]:
             """
@@ -146,10 +153,7 @@ def validate(*, location: Location, **fields: Union[Field, type],) -> Callable:
             :return: the remapped headers, with map keys being the specified ones.
             """
             filtered_headers = dict()
-            for field_key, field in fields.items():
-                lookup_key = (
-                    field.data_key if isinstance(field, Field) and field.data_key else field_key
-                )
+            for lookup_key in header_lookup_keys:
                 value = data.get(lookup_key)
                 if value is not None:
                     filtered_headers[lookup_key] = value
@@ -163,8 +167,9 @@ def validate(*, location: Location, **fields: Union[Field, type],) -> Callable:
             :raises: SchemaValidationException if any of the query args does not have exactly one
               value.
             """
-            if any(len(val) != 1 for val in data.values()):
-                raise SchemaValidationException("Query args with more than one value found.")
+            for val in data.values():
+                if len(val) != 1:
+                    raise SchemaValidationException("Query args with more than one value found.")
 
         def _validate_json_content_type(request: Request) -> None:
             """
@@ -173,27 +178,85 @@ def validate(*, location: Location, **fields: Union[Field, type],) -> Callable:
             :param request: the Sanic request object.
             :raises: SchemaValidationException if the content type is not application/json
             """
-            if (
-                request.method == "POST"
-                and request.headers.get("content-type", "missing").lower()
-                not in _ALLOWED_JSON_CONTENT_TYPES
-            ):
+            if request.method != "POST":
+                return
+            content_type = request.headers.get("content-type")
+            # NOTE: Clients sending the canonical lowercase form (the vast majority) skip the
+            #  lower() allocation entirely.
+            if content_type in _ALLOWED_JSON_CONTENT_TYPES:
+                return
+            if content_type is None or content_type.lower() not in _ALLOWED_JSON_CONTENT_TYPES:
                 raise SchemaValidationException(
                     "Content type is not application/json for post request."
                 )
 
+        location_attribute = location.value
+
+        def _extract_headers(request: Request) -> Dict[str, Any]:
+            return _remap_data_keys(getattr(request, location_attribute, {}))
+
+        def _extract_query(request: Request) -> Dict[str, Any]:
+            data = getattr(request, location_attribute, {})
+            _validate_query_args_length(data)
+            return data
+
+        def _extract_json(request: Request) -> Dict[str, Any]:
+            _validate_json_content_type(request)
+            return getattr(request, location_attribute, {})
+
+        # NOTE: The location is fixed at decoration time; binding its extractor here spares the
+        #  per-request branching on it.
+        extract = {
+            Location.HEADERS: _extract_headers,
+            Location.QUERY: _extract_query,
+            Location.JSON: _extract_json,
+        }[location]
+
+        @wraps(f)
+        async def _wrapper(request: Request, *args: Any, **kwargs: Any) -> HTTPResponse:
+            try:
+                valid_data = schema.load(extract(request))  # pylint: disable=no-member
+            except ValidationError as exc:
+                raise SchemaValidationException(exc.messages) from exc
+
+            if intersection := set(kwargs.keys()).intersection(set(valid_data.keys())):
+                raise ImmuniException(
+                    f"Trying to validate some fields more than once: {list(intersection)}."
+                )
+
+            kwargs.update(**valid_data)
+
+            return await f(request, *args, **kwargs)
+
         return _wrapper
 
     return _decorator
 
 
+# NOTE: A dedicated generator avoids contending on the random module's shared instance from
+#  within the event loop.
+_SLEEP_RANDOM = random.Random()
+_MILLIS_PER_SECOND = 1000.0
+
+
 async def wait_configured_time(mu: float, sigma: float) -> None:
     """
     Wait for the configured time.
     This is usually useful to make dummy requests last a similar amount of time when compared to the
     real ones, or slow down potential brute force attacks.
     """
-    await asyncio.sleep(random.normalvariate(mu, sigma) / 1000.0)
+    await asyncio.sleep(_SLEEP_RANDOM.normalvariate(mu, sigma) / _MILLIS_PER_SECOND)
+
+
+# NOTE: Created once at import time: these decorators (and the marshmallow field within) are
+#  identical for every endpoint handling dummy requests.
+_DUMMY_DATA_VALIDATION = validate(
+    location=Location.HEADERS,
+    is_dummy=IntegerBoolField(
+        required=True, allow_strings=True, data_key=HeaderImmuniDummyData.DATA_KEY,
+    ),
+)
+_DUMMY_DATA_DOC = doc.consumes(HeaderImmuniDummyData(), location="header", required=True)
 
 
 def handle_dummy_requests(
@@ -215,19 +278,18 @@ def handle_dummy_requests(
     def _decorator(
         f: Callable[..., Coroutine[Any, Any, HTTPResponse]]
     ) -> Callable[..., Coroutine[Any, Any, HTTPResponse]]:
-        @validate(
-            location=Location.HEADERS,
-            is_dummy=IntegerBoolField(
-                required=True, allow_strings=True, data_key=HeaderImmuniDummyData.DATA_KEY,
-            ),
-        )
-        @doc.consumes(HeaderImmuniDummyData(), location="header", required=True)
+        # NOTE: The weights are fixed at decoration time; the sampler precomputes its cumulative
+        #  weights once so each dummy request costs a single draw.
+        sample_response = weighted_sampler(responses)
+
+        @_DUMMY_DATA_VALIDATION
+        @_DUMMY_DATA_DOC
         async def _wrapper(*args: Any, is_dummy: bool, **kwargs: Any) -> HTTPResponse:
             if is_dummy:
                 await wait_configured_time(
                     mu=config.DUMMY_REQUEST_TIMEOUT_MILLIS, sigma=config.DUMMY_REQUEST_TIMEOUT_SIGMA
                 )
-                selected_response = weighted_random(responses)
+                selected_response = sample_response()
                 if isinstance(selected_response, ApiException):
                     raise selected_response
                 return selected_response
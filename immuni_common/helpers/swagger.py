@@ -11,6 +11,7 @@
 #  You should have received a copy of the GNU Affero General Public License
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+from functools import lru_cache
 from typing import Callable, Type
 
 from sanic_openapi import doc
@@ -18,9 +19,11 @@ from sanic_openapi import doc
 from immuni_common.core.exceptions import ApiException
 
 
+@lru_cache(maxsize=None)
 def doc_exception(exception: Type[ApiException]) -> Callable:
     """
     Decorator to document the provided exception in Swagger.
+    Memoized per exception class, the documentation objects being identical across endpoints.
 
     :param exception: the exception to document.
     :return: the decorator to document the provided exception.
@@ -18,12 +18,12 @@ environment only.
 
 import os
 import random
-from functools import wraps
+from functools import lru_cache, wraps
 from tempfile import TemporaryDirectory
 from types import ModuleType
-from typing import Any, AsyncGenerator, Callable, Generator, Iterable, Set
+from typing import Any, AsyncGenerator, Callable, FrozenSet, Generator, Iterable
 from unittest.mock import patch
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import prometheus_client.values
 import pytest
@@ -34,11 +34,11 @@ from immuni_common.core import config
 from immuni_common.models.enums import Environment
 from immuni_common.models.marshmallow.validators import OtpCodeValidator
 
-_ALLOWED_REDIS_SCHEMES = {"redis"}
-_ALLOWED_REDIS_HOSTNAMES = {"redis", "localhost"}
+_ALLOWED_REDIS_SCHEMES = frozenset({"redis"})
+_ALLOWED_REDIS_HOSTNAMES = frozenset({"redis", "localhost"})
 
-_ALLOWED_MONGO_SCHEMES = {"mongodb"}
-_ALLOWED_MONGO_HOSTNAMES = {"mongo", "localhost"}
+_ALLOWED_MONGO_SCHEMES = frozenset({"mongodb"})
+_ALLOWED_MONGO_HOSTNAMES = frozenset({"mongo", "localhost"})
 
 
 class OutsideTestingEnvironment(Exception):
@@ -70,11 +70,13 @@ class UnsafeTestingUrl(Exception):
         super().__init__(f"{config_name}: invalid '{value}' {field} (allowed: {list(allowed)})")
 
 
+@lru_cache(maxsize=None)
 def _check_testing_url(
-    url: str, config_name: str, allowed_schemes: Set[str], allowed_hostnames: Set[str]
+    url: str, config_name: str, allowed_schemes: FrozenSet[str], allowed_hostnames: FrozenSet[str]
 ) -> None:
     """
     Assess whether the given URL is suitable for a testing environment.
+    Successful checks are memoized: the same URLs get re-checked by every fixture using them.
 
     :param url: the URL of the configuration environment variable.
     :param config_name: the name of the configuration environment variable.
@@ -82,7 +84,7 @@ def _check_testing_url(
     :param allowed_hostnames: the allowed values for the hostname URL field.
     :raises: UnsafeTestingUrl if either the scheme or hostname is not among the allowed ones.
     """
-    parsed = urlparse(url)
+    parsed = urlsplit(url)
     if parsed.scheme not in allowed_schemes:
         raise UnsafeTestingUrl(
             config_name=config_name, field="scheme", value=parsed.scheme, allowed=allowed_schemes
@@ -165,10 +167,12 @@ def create_no_expired_keys_fixture(redis: Redis) -> FixtureFunctionMarker:
         yield
 
         keys = await redis.keys("*")
-        keys_without_expiration = set()
+        # NOTE: A single pipelined round-trip instead of one TTL command per key.
+        pipeline = redis.pipeline()
         for key in keys:
-            if await redis.ttl(key) == -1:
-                keys_without_expiration.add(keys)
+            pipeline.ttl(key)
+        ttls = await pipeline.execute()
+        keys_without_expiration = {key for key, ttl in zip(keys, ttls) if ttl == -1}
         if len(keys_without_expiration) != 0:
             raise RuntimeError(
                 f"There are Redis keys without TTL, namely {list(keys_without_expiration)}."
@@ -222,7 +226,9 @@ def generate_otp(length: int = 10, skip_validation: bool = False) -> str:
         raise RuntimeError("Cannot generate such a short OTP code.")
 
     chars = random.choices(OtpCodeValidator._ALPHABET, k=length - 1)  # no-qa
-    otp = "".join(chars) + OtpCodeValidator._compute_check_digit(chars)  # no-qa
+    # NOTE: The check digit is computed before the append, on the digit-less chars.
+    chars.append(OtpCodeValidator._compute_check_digit(chars))  # no-qa
+    otp = "".join(chars)
 
     if not skip_validation and not OtpCodeValidator._is_valid_otp(otp):
         raise RuntimeError(f"An invalid OTP code has been generated: {otp}.")
@@ -11,51 +11,58 @@
 #  You should have received a copy of the GNU Affero General Public License
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-import os
-import pkgutil
 import random
+from bisect import bisect
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from types import ModuleType
-from typing import Dict, Generic, List, TypeVar
+from typing import Callable, Dict, Generic, List, TypeVar
 
 from immuni_common.core.exceptions import ImmuniException
 
 
+@lru_cache(maxsize=None)
 def modules_in_package(package: ModuleType) -> List[str]:
     """
     Retrieve the list of modules within a package, recursively.
+    The result is memoized, the modules within a package being stable for the process lifetime.
 
     :param package: the starting point package for retrieval of modules.
     :return: the list of modules within the given package.
     """
-
-    def _modules_in_package(package_dir: str, package_name: str) -> List[str]:
-        modules = list()
-        for mod in pkgutil.walk_packages([package_dir], prefix=f"{package_name}."):
-            sub_module = mod.name
-            if mod.ispkg:
-                modules.extend(
-                    _modules_in_package(os.path.join(mod.module_finder.path, mod.name), sub_module)
-                )
-            else:
-                modules.append(sub_module)
-        return modules
-
-    return _modules_in_package(os.path.dirname(package.__file__), package.__name__)
+    # NOTE: A plain filesystem walk; deriving the module names from the paths avoids the
+    #  per-directory finder machinery of pkgutil altogether.
+    root = Path(package.__file__).parent
+    return sorted(
+        f"{package.__name__}." + ".".join(path.relative_to(root).with_suffix("").parts)
+        for path in root.rglob("*.py")
+        if path.stem != "__init__"
+    )
 
 
 def dense_dict(dictionary: Dict) -> Dict:
     """
     Return a dictionary ignoring keys with None values, recursively.
+    Implemented with an explicit stack instead of recursion, avoiding one Python frame per level
+    of nesting.
 
     :param dictionary: the input dictionary, possibly containing None values.
     :return: a new dictionary without keys having a None value.
     """
-    return {
-        k: dense_dict(v) if isinstance(v, dict) else v
-        for k, v in dictionary.items()
-        if v is not None
-    }
+    result: Dict = dict()
+    stack = [(dictionary, result)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if value is None:
+                continue
+            if isinstance(value, dict):
+                target[key] = child = dict()
+                stack.append((value, child))
+            else:
+                target[key] = value
+    return result
 
 
 T = TypeVar("T")
@@ -68,22 +75,53 @@ class WeightedPayload(Generic[T]):
     weighted key/value pairs for weighted random.
     """
 
+    __slots__ = ("weight", "payload")
+
     weight: int
     payload: T
 
 
-def weighted_random(pairs: List[WeightedPayload[T]]) -> T:
+def weighted_sampler(pairs: List[WeightedPayload[T]]) -> Callable[[], T]:
     """
-    Returns one of the values in the WeightedPair list randomly based on the
+    Build a sampler drawing one of the values in the WeightedPair list randomly based on the
     weights defined in the given WeightedPair list.
+    The cumulative weights are computed once here, so that each draw only costs a single bisect;
+    callers sampling repeatedly from the same pairs should build the sampler once and reuse it.
 
-    :param pairs: The list of WeightedPair to pick the random value from.
+    :param pairs: The list of WeightedPair to pick the random values from.
+    :return: the zero-argument sampler.
+    :raises: ImmuniException if any weight is negative or the total weight is not positive.
     """
 
     # Note: We allow 0 weights so that this function is testable and tests are not random.
-    if any(pair.weight < 0 for pair in pairs):
-        raise ImmuniException("Cannot perform a weighted random with negative weights.")
+    population = []
+    cumulative_weights = []
+    total = 0
+    for pair in pairs:
+        if pair.weight < 0:
+            raise ImmuniException("Cannot perform a weighted random with negative weights.")
+        total += pair.weight
+        population.append(pair.payload)
+        cumulative_weights.append(total)
+
+    if total <= 0:
+        raise ImmuniException("Cannot perform a weighted random with zero total weight.")
+
+    last_index = len(population) - 1
 
-    return random.choices(
-        population=tuple(p.payload for p in pairs), weights=tuple(p.weight for p in pairs), k=1,
-    )[0]
+    def _sample() -> T:
+        # Single-sample version of what random.choices does internally, without its k-sized list
+        # and per-call cumulative-weights construction.
+        return population[bisect(cumulative_weights, random.random() * total, 0, last_index)]
+
+    return _sample
+
+
+def weighted_random(pairs: List[WeightedPayload[T]]) -> T:
+    """
+    Returns one of the values in the WeightedPair list randomly based on the
+    weights defined in the given WeightedPair list.
+
+    :param pairs: The list of WeightedPair to pick the random value from.
+    """
+    return weighted_sampler(pairs)()
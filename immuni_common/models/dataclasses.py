@@ -24,6 +24,15 @@ class ExposureInfo:
     Exposure Info provided by the clients.
     """
 
+    __slots__ = (
+        "date",
+        "duration",
+        "attenuation_value",
+        "attenuation_durations",
+        "transmission_risk_level",
+        "total_risk_score",
+    )
+
     date: date
     duration: int
     attenuation_value: int
@@ -38,6 +47,15 @@ class ExposureDetectionSummary:
     Exposure Detection Summary provided by the clients.
     """
 
+    __slots__ = (
+        "date",
+        "matched_key_count",
+        "days_since_last_exposure",
+        "attenuation_durations",
+        "maximum_risk_score",
+        "exposure_info",
+    )
+
     date: date
     matched_key_count: int
     days_since_last_exposure: int
@@ -52,5 +70,7 @@ class OtpData:
     Information associated with an OTP received from the health information system (HIS).
     """
 
+    __slots__ = ("id_test_verification", "symptoms_started_on")
+
     id_test_verification: Optional[str]
     symptoms_started_on: date
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import logging
 from enum import Enum
+from functools import lru_cache
 from typing import Type, TypeVar
 
 from immuni_common.core.exceptions import ImmuniException
@@ -28,9 +29,12 @@ class EnvarEnum(Enum):
     """
 
     @classmethod
+    @lru_cache(maxsize=None)
     def from_env_var(cls: Type[T], value: str) -> T:
         """
         Parse the environment variable value and provide an informative error message on failure.
+        Memoized, since multiple configurations may be cast from the very same value: Enum already
+        maintains a value-to-member map, so the cache mostly skips the try/except machinery.
 
         :param value: the environment variable value.
         :return: the corresponding Enum entry.
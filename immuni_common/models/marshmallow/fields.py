@@ -11,6 +11,7 @@
 #  You should have received a copy of the GNU Affero General Public License
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import re
 import sys
 from enum import Enum
 from typing import Any, Optional, Type
@@ -27,6 +28,10 @@ from immuni_common.models.marshmallow.validators import (
 
 VALID_COUNTRY_REGEX = r"^[A-Z]{2}$"
 
+# NOTE: One shared instance for the many non-negative integer fields across the schemas, instead
+#  of one Range object per field declaration.
+NON_NEGATIVE_RANGE = Range(min=0, max=sys.maxsize)
+
 
 class AttenuationDurations(List):
     """
@@ -35,11 +40,19 @@ class AttenuationDurations(List):
 
     def __init__(self) -> None:
         super().__init__(
-            Integer(validate=Range(min=0, max=sys.maxsize)),
-            required=True,
-            validate=Length(min=3, max=4),
+            Integer(validate=NON_NEGATIVE_RANGE), required=True, validate=Length(min=3, max=4),
         )
 
+    def _deserialize(self, value: Any, attr: Any, data: Any, **kwargs: Any) -> Any:
+        # NOTE: Well-formed payloads (the vast majority) skip the per-element Integer/Range
+        #  dispatch; anything else falls back to the generic machinery and its error messages.
+        if isinstance(value, list) and all(
+            type(item) is int and 0 <= item <= sys.maxsize  # pylint: disable=unidiomatic-typecheck
+            for item in value
+        ):
+            return list(value)
+        return super()._deserialize(value, attr, data, **kwargs)
+
 
 class Base64String(String):
     """
@@ -88,6 +101,9 @@ class EnumField(Field):
         :param enum: the Enum class to validate against.
         """
         self._enum: Type[Enum] = enum
+        # NOTE: Precomputed once; the member names only serve failure messages, yet were being
+        #  rebuilt on every failed deserialization.
+        self._enum_names = [e.name for e in enum]
         super().__init__(required=True)
 
     def _serialize(self, value: Any, attr: str, obj: Any, **kwargs: Any) -> Any:
@@ -97,7 +113,7 @@ class EnumField(Field):
         try:
             return self._enum(value)
         except ValueError as error:
-            raise ValidationError(f"{value} is not in {[e.name for e in self._enum]}") from error
+            raise ValidationError(f"{value} is not in {self._enum_names}") from error
 
 
 class IntegerBoolField(Field):
@@ -145,8 +161,11 @@ class Province(String):
     Validate the province.
     """
 
+    # NOTE: Compiled and wrapped once; every field instantiation was re-compiling the pattern.
+    _VALIDATOR = validate.Regexp(re.compile(r"^[A-Z]{2}$"))
+
     def __init__(self) -> None:
-        super().__init__(required=True, validate=validate.Regexp(r"^[A-Z]{2}$"))
+        super().__init__(required=True, validate=self._VALIDATOR)
 
 
 class RiskScore(Integer):
@@ -155,7 +174,7 @@ class RiskScore(Integer):
     """
 
     def __init__(self) -> None:
-        super().__init__(required=True, validate=Range(min=0, max=sys.maxsize))
+        super().__init__(required=True, validate=NON_NEGATIVE_RANGE)
 
 
 class Countries(List):
@@ -11,7 +11,6 @@
 #  You should have received a copy of the GNU Affero General Public License
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-import sys
 from typing import Any, Dict
 
 from marshmallow import Schema, fields, post_load
@@ -25,6 +24,7 @@ from immuni_common.models.marshmallow.fields import (
     Base64String,
     EnumField,
     IsoDate,
+    NON_NEGATIVE_RANGE,
     RiskScore,
 )
 from immuni_common.models.mongoengine.temporary_exposure_key import TemporaryExposureKey
@@ -56,7 +56,7 @@ class TemporaryExposureKeySchema(Schema):
     """
 
     key_data = Base64String(required=True, length=16)
-    rolling_start_number = fields.Integer(required=True, validate=Range(min=0, max=sys.maxsize))
+    rolling_start_number = fields.Integer(required=True, validate=NON_NEGATIVE_RANGE)
     rolling_period = fields.Integer(
         required=False, validate=Range(min=0, max=config.MAX_ROLLING_PERIOD)
     )
@@ -81,8 +81,8 @@ class ExposureInfoSchema(Schema):
     """
 
     date = IsoDate()
-    duration = fields.Integer(required=True, validate=Range(min=0, max=sys.maxsize))
-    attenuation_value = fields.Integer(required=True, validate=Range(min=0, max=sys.maxsize))
+    duration = fields.Integer(required=True, validate=NON_NEGATIVE_RANGE)
+    attenuation_value = fields.Integer(required=True, validate=NON_NEGATIVE_RANGE)
     attenuation_durations = AttenuationDurations()
     transmission_risk_level = EnumField(TransmissionRiskLevel)
     total_risk_score = RiskScore()
@@ -107,8 +107,8 @@ class ExposureDetectionSummarySchema(Schema):
     """
 
     date = IsoDate()
-    matched_key_count = fields.Integer(required=True, validate=Range(min=0, max=sys.maxsize))
-    days_since_last_exposure = fields.Integer(required=True, validate=Range(min=0, max=sys.maxsize))
+    matched_key_count = fields.Integer(required=True, validate=NON_NEGATIVE_RANGE)
+    days_since_last_exposure = fields.Integer(required=True, validate=NON_NEGATIVE_RANGE)
     attenuation_durations = AttenuationDurations()
     maximum_risk_score = RiskScore()
     exposure_info = fields.Nested(ExposureInfoSchema, many=True)
@@ -11,11 +11,11 @@
 #  You should have received a copy of the GNU Affero General Public License
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-import base64
 import binascii
 import re
+import time
 from datetime import date, timedelta
-from typing import Iterable, Optional
+from typing import Callable, ClassVar, Dict, Optional, Sequence, Tuple
 
 from marshmallow import ValidationError
 from marshmallow.validate import Validator
@@ -24,6 +24,21 @@ from immuni_common.core import config
 
 OTP_LENGTH = 10
 
+# Sentinel marking characters outside of the OTP alphabet in the position lookup tables.
+_INVALID_OTP_CHAR = 0xFF
+
+_OTP_SHA_RE = re.compile(r"[A-Fa-f0-9]{64}")
+
+
+def _build_position_lut(position_map: Dict[str, int]) -> bytes:
+    """
+    Build a 256-entry lookup table mapping a character's ordinal to its positional value.
+
+    :param position_map: the character-to-value map to flatten.
+    :return: the lookup table, with _INVALID_OTP_CHAR flagging characters outside the map.
+    """
+    return bytes(position_map.get(chr(ordinal), _INVALID_OTP_CHAR) for ordinal in range(256))
+
 
 class Base64StringValidator(Validator):
     """
@@ -40,22 +55,35 @@ class Base64StringValidator(Validator):
         self._length = length
         self._min_encoded_length = min_encoded_length
         self._max_encoded_length = max_encoded_length
+        # NOTE: The encoded length implied by the expected decoded one, so that most invalid
+        #  values are rejected upfront, before paying for the actual decoding.
+        self._expected_encoded_length = ((length + 2) // 3) * 4 if length else None
 
     def __call__(self, value: str) -> str:
-        if self._min_encoded_length and (length := len(value)) < self._min_encoded_length:
+        # Computed once and shared by all of the length checks below.
+        length = len(value)
+
+        if self._min_encoded_length and length < self._min_encoded_length:
             raise ValidationError(
                 f"Invalid base64 string length: {length} minimum required length "
                 f"{self._min_encoded_length}."
             )
 
-        if self._max_encoded_length and (length := len(value)) > self._max_encoded_length:
+        if self._max_encoded_length and length > self._max_encoded_length:
             raise ValidationError(
                 f"Invalid base64 string length: {length} maximum required length "
                 f"{self._max_encoded_length}."
             )
 
+        if (expected := self._expected_encoded_length) and length != expected:
+            raise ValidationError(
+                f"Invalid base64 string length: {length} instead of {expected}."
+            )
+
         try:
-            decoded = base64.b64decode(value)
+            # NOTE: Directly what base64.b64decode boils down to, minus the altchars handling
+            #  this validator never needs.
+            decoded = binascii.a2b_base64(value)
         except binascii.Error as error:
             raise ValidationError("Invalid base64 string.") from error
         if self._length and (length := len(decoded)) != self._length:
@@ -71,6 +99,25 @@ class IsoDateValidator(Validator):
     """
 
     _ALLOWED_TIMEDELTA = timedelta(days=config.MAX_ISO_DATE_BACKWARD_DIFF)
+    _TODAY_TTL_SECONDS = 1.0
+
+    _today_cache: ClassVar[Tuple[float, date]] = (float("-inf"), date.min)
+
+    @classmethod
+    def _today(cls) -> date:
+        """
+        Return the current date, refreshed at most once per _TODAY_TTL_SECONDS.
+        Batch requests validate several dates each, and date.today() pays a system call every
+        time.
+
+        :return: the current date.
+        """
+        now = time.monotonic()
+        cached_at, today = cls._today_cache
+        if now - cached_at >= cls._TODAY_TTL_SECONDS:
+            today = date.today()
+            cls._today_cache = (now, today)
+        return today
 
     def __call__(self, value: date) -> None:
         """
@@ -81,10 +128,11 @@ class IsoDateValidator(Validator):
           ValidationError: if the date is more than _ALLOWED_TIMEDELTA days old.
           ValidationError: if the date is in the future.
         """
-        today = date.today()
+        today = self._today()
         if value > today:
             raise ValidationError(f"{value} is in the future.")
-        if (today - value) > self._ALLOWED_TIMEDELTA:
+        # NOTE: Ordinal arithmetic spares the intermediate timedelta allocation.
+        if today.toordinal() - value.toordinal() > self._ALLOWED_TIMEDELTA.days:
             raise ValidationError(f"{value} is too far back in time.")
 
 
@@ -175,34 +223,48 @@ class OtpCodeValidator(Validator):
         "8",
         "9",
     )
-    _CHECK_DIGIT_MAP = dict(enumerate(_ALPHABET))
+
+    # NOTE: Flat 256-entry tables indexed by character ordinal; unlike the dict lookups they
+    #  replace on the hot path, indexing bytes involves no hashing.
+    _ODD_LUT = _build_position_lut(_ODD_MAP)
+    _EVEN_LUT = _build_position_lut(_EVEN_MAP)
+
+    # Populated right after the class body, once the classmethods can be bound.
+    _DISPATCH: ClassVar[Dict[int, Tuple[Callable[[str], bool], str]]] = {}
+    _SHA_DISPATCH: ClassVar[Tuple[Callable[[str], bool], str]]
 
     def __call__(self, value: str) -> str:
-        if len(value) == OTP_LENGTH:
-            if not self._is_valid_otp(value):
-                raise ValidationError("Invalid OTP code.")
-        else:
-            if not self._is_valid_otp_sha(value):
-                raise ValidationError("Invalid OTP SHA256 code.")
+        # NOTE: Prebound checkers looked up by length; no per-call classmethod binding, and the
+        #  length branch collapses into a dict lookup with the SHA256 format as the fallback.
+        checker, error_message = self._DISPATCH.get(len(value), self._SHA_DISPATCH)
+        if not checker(value):
+            raise ValidationError(error_message)
         return value
 
     @classmethod
-    def _compute_check_digit(cls, otp_without_check_digit: Iterable[str]) -> str:
+    def _compute_check_digit(cls, otp_without_check_digit: Sequence[str]) -> str:
         """
         Compute the check digit of the OTP code.
 
         :param otp_without_check_digit: the OTP code without the check digit.
         :return: the check digit char.
         """
+        code = (
+            otp_without_check_digit
+            if isinstance(otp_without_check_digit, str)
+            else "".join(otp_without_check_digit)
+        )
         try:
-            char_sum = sum(
-                cls._ODD_MAP[char] if (index + 1) % 2 else cls._EVEN_MAP[char]
-                for index, char in enumerate(otp_without_check_digit)
-            )
-            check_digit = cls._CHECK_DIGIT_MAP[char_sum % 25]
-        except KeyError as error:
+            encoded = code.encode("ascii")
+        except UnicodeEncodeError as error:
             raise ValidationError("The OTP code contains forbidden characters.") from error
-        return check_digit
+        # NOTE: Slicing out the odd and even positions and mapping them via bytes.translate keeps
+        #  the whole computation in C; no interpreter-level per-character work remains.
+        odd_values = encoded[::2].translate(cls._ODD_LUT)
+        even_values = encoded[1::2].translate(cls._EVEN_LUT)
+        if _INVALID_OTP_CHAR in odd_values or _INVALID_OTP_CHAR in even_values:
+            raise ValidationError("The OTP code contains forbidden characters.")
+        return cls._ALPHABET[(sum(odd_values) + sum(even_values)) % 25]
 
     @classmethod
     def _is_valid_otp(cls, otp: str) -> bool:
@@ -226,6 +288,10 @@ class OtpCodeValidator(Validator):
         :param otp: the OTP code to validate.
         :return: True if the OTP code is valid, False otherwise.
         """
-        if otp is None or not re.match(r"^[A-Fa-f0-9]{64}$", str(otp)):
-            return False
-        return True
+        # NOTE: The isinstance guard replaces the str() coercion; non-string values can never
+        #  match and skip the regex entirely.
+        return isinstance(otp, str) and _OTP_SHA_RE.fullmatch(otp) is not None
+
+
+OtpCodeValidator._DISPATCH[OTP_LENGTH] = (OtpCodeValidator._is_valid_otp, "Invalid OTP code.")
+OtpCodeValidator._SHA_DISPATCH = (OtpCodeValidator._is_valid_otp_sha, "Invalid OTP SHA256 code.")
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import logging
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from bson import ObjectId
@@ -33,6 +34,37 @@ from immuni_common.models.mongoengine.temporary_exposure_key import TemporaryExp
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _oldest_and_newest_indexes_pipeline(today: date, days: int) -> List[Dict]:
+    """
+    Build the aggregation pipeline for retrieving the oldest and newest indexes.
+    Memoized on the (today, days) pair, so repeated polls within the same day reuse the stages
+    instead of re-allocating them; the cache naturally rolls over at midnight.
+
+    :param today: the current date.
+    :param days: the number of days since when to look for relevant batches.
+    :return: the list of aggregation stages to perform the query.
+    """
+    return [
+        {
+            "$match": {
+                "period_start": {
+                    "$gt": datetime.combine(today, datetime.min.time()) - timedelta(days=days)
+                }
+            }
+        },
+        {"$sort": {"index": 1}},
+        {
+            "$group": {
+                "_id": None,
+                "oldest": {"$first": "$index"},
+                "newest": {"$last": "$index"},
+            }
+        },
+        {"$project": {"_id": 0, "oldest": 1, "newest": 1}},
+    ]
+
+
 class BatchFile(Document):
     """
     Document to wrap a batch of TEKs.
@@ -75,10 +107,14 @@ class BatchFile(Document):
 
         :return: the period_end and index tuple if there is at least a BatchFile, None otherwise.
         """
-        last_batch = cls.objects.order_by("-index").only("period_end", "index").first()
+        # NOTE: A raw projected find_one; hydrating a whole Document (empty keys list included)
+        #  just to read two scalar fields is needless overhead.
+        last_batch = cls._get_collection().find_one(
+            {}, projection={"period_end": 1, "index": 1, "_id": 0}, sort=[("index", -1)]
+        )
         if not last_batch:
             return None
-        return last_batch.period_end, last_batch.index
+        return last_batch["period_end"], last_batch["index"]
 
     @classmethod
     def delete_older_than(cls, datetime_: datetime) -> int:
@@ -98,25 +134,7 @@ class BatchFile(Document):
         :param days: the number of days since when to look for relevant BatchFiles.
         :return: the list of aggregation stages to perform the query.
         """
-        return [
-            {
-                "$match": {
-                    "period_start": {
-                        "$gt": datetime.combine(date.today(), datetime.min.time())
-                        - timedelta(days=days)
-                    }
-                }
-            },
-            {"$sort": {"index": 1}},
-            {
-                "$group": {
-                    "_id": None,
-                    "oldest": {"$first": "$index"},
-                    "newest": {"$last": "$index"},
-                }
-            },
-            {"$project": {"_id": 0, "oldest": 1, "newest": 1}},
-        ]
+        return _oldest_and_newest_indexes_pipeline(date.today(), days)
 
     @classmethod
     def get_oldest_and_newest_indexes(cls, days: int) -> Dict[str, int]:
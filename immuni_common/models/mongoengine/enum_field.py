@@ -52,6 +52,12 @@ class EnumField(StringField):
         :return: the Python Enum entry corresponding to the given value.
         :raises: ValidationError if the value is invalid.
         """
+        # NOTE: Mongo hands back plain member-name strings, so one lookup in the Enum's member
+        #  map covers virtually every document load.
+        try:
+            return self._enum[value]
+        except (KeyError, TypeError):
+            pass
         if isinstance(value, self._enum):
             return value
         string_value = super().to_python(value)
@@ -68,6 +74,10 @@ class EnumField(StringField):
         :param value: the value to validate.
         :raises: ValidationError if the value is not one of the Enum entries.
         """
+        # NOTE: Valid values are members of the very Enum class, settled by one identity check;
+        #  the containment fallback keeps raising TypeError for non-Enum values.
+        if value.__class__ is self._enum:
+            return
         if value not in self._enum:
             self._invalid_value_error(value)
 
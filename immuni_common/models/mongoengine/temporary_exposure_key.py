@@ -23,6 +23,9 @@ from immuni_common.helpers.sanic import Serializable
 from immuni_common.models.enums import TransmissionRiskLevel
 from immuni_common.models.mongoengine.enum_field import EnumField
 
+# The duration of a rolling interval (10 minutes), precomputed in seconds.
+_ROLLING_INTERVAL_SECONDS = int(timedelta(minutes=10).total_seconds())
+
 
 class TemporaryExposureKey(EmbeddedDocument, Serializable):
     """
@@ -44,9 +47,7 @@ class TemporaryExposureKey(EmbeddedDocument, Serializable):
 
         :return: the datetime when the key was created.
         """
-        return datetime.utcfromtimestamp(
-            self.rolling_start_number * timedelta(minutes=10).total_seconds()
-        )
+        return datetime.utcfromtimestamp(self.rolling_start_number * _ROLLING_INTERVAL_SECONDS)
 
     @property
     def expires_at(self) -> datetime:
@@ -55,7 +56,11 @@ class TemporaryExposureKey(EmbeddedDocument, Serializable):
 
         :return: the datetime the current key expires.
         """
-        return self.created_at + timedelta(minutes=10 * self.rolling_period)
+        # NOTE: Computed in one shot from the timestamps; going through created_at would allocate
+        #  an intermediate datetime and timedelta per access.
+        return datetime.utcfromtimestamp(
+            (self.rolling_start_number + self.rolling_period) * _ROLLING_INTERVAL_SECONDS
+        )
 
     def serialize(self) -> Dict[str, Any]:
         """
@@ -63,9 +68,12 @@ class TemporaryExposureKey(EmbeddedDocument, Serializable):
 
         :return: the serialized TemporaryExposureKey.
         """
-        return dict(
-            key_data=self.key_data,
-            transmission_risk_level=self.transmission_risk_level.value,  # pylint: disable=no-member
-            rolling_start_number=self.rolling_start_number,
-            countries_of_interest=self.countries_of_interest,
-        )
+        # NOTE: A dict literal is assembled in a single bytecode op, unlike the dict() call with
+        #  its keyword packing; serialization runs once per key in every batch.
+        transmission_risk_level = self.transmission_risk_level  # pylint: disable=no-member
+        return {
+            "key_data": self.key_data,
+            "transmission_risk_level": transmission_risk_level.value,
+            "rolling_start_number": self.rolling_start_number,
+            "countries_of_interest": self.countries_of_interest,
+        }
@@ -40,18 +40,19 @@ _BUILD_INFO = Gauge(
     multiprocess_mode="liveall",
 )
 
+# NOTE: The build labels are fixed for the process lifetime; resolving the child once at import
+#  spares the labels lookup on every (re-)initialization.
+_BUILD_INFO_CHILD = _BUILD_INFO.labels(
+    config.GIT_SHA[:7], config.GIT_SHA, config.GIT_BRANCH, config.GIT_TAG, config.BUILD_DATE
+)
+
 
-def _expose_build_info(git_sha: str, git_branch: str, git_tag: str, build_date: str) -> None:
+def _expose_build_info() -> None:
     """
     Expose the build information as a Prometheus metric.
-
-    :param git_sha: the Git SHA of the running code.
-    :param git_branch: the Git branch of the running code.
-    :param git_tag: the Git tag of the running code.
-    :param build_date: the date the running code image was built.
     """
 
-    _BUILD_INFO.labels(git_sha[:7], git_sha, git_branch, git_tag, build_date).set(1)
+    _BUILD_INFO_CHILD.set(1)
 
 
 def initialize_monitoring() -> CollectorRegistry:
@@ -62,10 +63,5 @@ def initialize_monitoring() -> CollectorRegistry:
     """
     registry = CollectorRegistry()
     multiprocess.MultiProcessCollector(registry)
-    _expose_build_info(
-        git_sha=config.GIT_SHA,
-        git_branch=config.GIT_BRANCH,
-        git_tag=config.GIT_TAG,
-        build_date=config.BUILD_DATE,
-    )
+    _expose_build_info()
     return registry
@@ -36,6 +36,12 @@ from immuni_common.monitoring.sanic import sanic_after_request_handler, sanic_be
 
 _LOGGER = logging.getLogger(__name__)
 
+# The fallback error body never changes at runtime; built once instead of per failing request.
+_UNKNOWN_ERROR_BODY = {
+    "error_code": ApiException.error_code,
+    "message": ApiException.error_message,
+}
+
 
 # pylint: disable=too-many-locals
 def create_app(
@@ -50,19 +56,9 @@ def create_app(
     :param managers: the microservice's managers.
     :return: the created Sanic application.
     """
+    env = config.ENV
     app = Sanic(__name__, log_config=get_sanic_logger_config(config.LOG_JSON_INDENT))
-    app.config.TESTING = config.ENV == Environment.TESTING
-
-    swagger_config = dict(
-        API_TITLE=api_title,
-        API_DESCRIPTION=api_description,
-        API_SCHEMES=["https"],
-        API_VERSION="1.0.0",
-        SWAGGER_UI_CONFIGURATION=dict(
-            validatorUrl=None, displayRequestDuration=True, docExpansion="list",
-        ),
-    )
-    app.config.update(swagger_config)
+    app.config.TESTING = env == Environment.TESTING
 
     monitoring_registry = initialize_monitoring()
 
@@ -78,11 +74,11 @@ def create_app(
     @doc.summary("Expose Prometheus metrics.")
     @cache(no_store=True)
     async def metrics(request: Request) -> HTTPResponse:
-        latest_metrics = prometheus_client.generate_latest(monitoring_registry)
+        # NOTE: The exposition payload is handed over as bytes; decoding it just for Sanic to
+        #  re-encode it (and re-measure its length) would walk the payload two extra times.
         return HTTPResponse(
-            body=latest_metrics.decode("utf-8"),
+            body_bytes=prometheus_client.generate_latest(monitoring_registry),
             content_type=prometheus_client.CONTENT_TYPE_LATEST,
-            headers={"Content-Length": str(len(latest_metrics))},
         )
 
     @app.listener("after_server_start")
@@ -108,32 +104,44 @@ def create_app(
     @app.exception(ApiException)
     async def handle_exception(request: Request, exception: ApiException) -> HTTPResponse:
         _LOGGER.exception(exception)
-        return json_response(
-            body={"error_code": exception.error_code, "message": exception.error_message},
-            status=exception.status_code,
+        # NOTE: The error body only depends on the exception class; the pre-serialized bytes
+        #  skip a dict build and a JSON encode per rejected request.
+        return HTTPResponse(
+            body_bytes=type(exception).cached_body(),
+            status=exception.status_code.value,
+            content_type="application/json; charset=utf-8",
         )
 
     @app.exception(SanicException)
     async def handle_unknown_exception(request: Request, exception: SanicException) -> HTTPResponse:
         _LOGGER.exception(exception)
         return json_response(
-            body={"error_code": ApiException.error_code, "message": ApiException.error_message},
-            status=HTTPStatus(exception.status_code),
+            body=_UNKNOWN_ERROR_BODY, status=HTTPStatus(exception.status_code),
         )
 
     @app.exception(Exception)
     async def handle_bare_exception(request: Request, exception: Exception) -> HTTPResponse:
         _LOGGER.exception(exception)
-        return json_response(
-            body={"error_code": ApiException.error_code, "message": ApiException.error_message},
-            status=ApiException.status_code,
-        )
+        return json_response(body=_UNKNOWN_ERROR_BODY, status=ApiException.status_code)
 
     for blueprint in blueprints:
         app.blueprint(blueprint)
 
-    if config.ENV != Environment.RELEASE:
+    if env != Environment.RELEASE:
         # It's a good practice to avoid opening the swagger endpoints in a production environment.
+        # NOTE: The swagger configuration only feeds the blueprint below, so production builds
+        #  skip assembling it altogether.
+        app.config.update(
+            dict(
+                API_TITLE=api_title,
+                API_DESCRIPTION=api_description,
+                API_SCHEMES=["https"],
+                API_VERSION="1.0.0",
+                SWAGGER_UI_CONFIGURATION=dict(
+                    validatorUrl=None, displayRequestDuration=True, docExpansion="list",
+                ),
+            )
+        )
         app.blueprint(swagger_blueprint)
 
     return app
@@ -15,27 +15,32 @@ import argparse
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from subprocess import call
+from subprocess import CompletedProcess, call, run
 from typing import Tuple
 
 logging.basicConfig(format="[%(asctime)s][%(levelname)s] %(message)s", level=logging.INFO)
 _LOGGER = logging.getLogger(__name__)
 
-_ALLOWED_SERVICE_DIRNAMES = {
-    "immuni_common",
-    "immuni_analytics",
-    "immuni_app_configuration",
-    "immuni_exposure_ingestion",
-    "immuni_exposure_reporting",
-    "immuni_otp",
-}
+_ALLOWED_SERVICE_DIRNAMES = frozenset(
+    {
+        "immuni_common",
+        "immuni_analytics",
+        "immuni_app_configuration",
+        "immuni_exposure_ingestion",
+        "immuni_exposure_reporting",
+        "immuni_otp",
+    }
+)
+# Sorted once, making the failure message deterministic across runs.
+_ALLOWED_SERVICE_DIRNAMES_LIST = sorted(_ALLOWED_SERVICE_DIRNAMES)
 
 
 def _validate_service_dirname(service_dirname: str) -> str:
     if service_dirname not in _ALLOWED_SERVICE_DIRNAMES:
         raise argparse.ArgumentTypeError(
-            f"Invalid value '{service_dirname}' (allowed: {list(_ALLOWED_SERVICE_DIRNAMES)})."
+            f"Invalid value '{service_dirname}' (allowed: {_ALLOWED_SERVICE_DIRNAMES_LIST})."
         )
     return service_dirname
 
@@ -106,14 +111,39 @@ def _run_command(command: Tuple[str, ...]) -> int:
     return exit_code
 
 
+def _run_command_capturing(command: Tuple[str, ...]) -> "CompletedProcess":
+    _LOGGER.info(f"Running: {' '.join(command)}")
+    return run(command, capture_output=True, text=True)
+
+
+def _run_commands_concurrently(commands: Tuple[Tuple[str, ...], ...]) -> bool:
+    """
+    Run the given commands in concurrent subprocesses, printing the captured outputs in
+    submission order once each command has finished.
+
+    :param commands: the commands to run.
+    :return: True if at least one command failed, False otherwise.
+    """
+    any_failure = False
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        for command, result in zip(commands, executor.map(_run_command_capturing, commands)):
+            if result.stdout:
+                print(result.stdout, end="")
+            if result.stderr:
+                print(result.stderr, end="", file=sys.stderr)
+            _LOGGER.info(f"Done: {command[0]} exit code is {result.returncode}")
+            any_failure = any_failure or result.returncode != os.EX_OK
+    return any_failure
+
+
 def checks() -> None:
     """
     Run different linters and checks while keeping all configuration within the common repository.
-    NOTE: The commands run sequentially to avoid messing up the output in case multiple linters
-      produce warnings.
+    NOTE: In CI mode no command applies changes, so they all run concurrently with their outputs
+      serialized afterwards; the wall time is that of the slowest linter. Outside of CI, isort
+      and black rewrite files, hence the commands keep running sequentially.
     """
     arguments = _parse_args()
-    any_failure = False
 
     commands = (
         _isort_command(arguments.ci),
@@ -124,9 +154,13 @@ def checks() -> None:
         _pylint_command(arguments.service_dirname, arguments.ci),
     )
 
-    for command in commands:
-        exit_code = _run_command(command)
-        any_failure = any_failure or exit_code != os.EX_OK
+    if arguments.ci:
+        any_failure = _run_commands_concurrently(commands)
+    else:
+        any_failure = False
+        for command in commands:
+            exit_code = _run_command(command)
+            any_failure = any_failure or exit_code != os.EX_OK
 
     if any_failure:
         _LOGGER.error("At least one check failed. Please fix them before proceeding.")
@@ -17,6 +17,7 @@ from typing import Generator, Iterable
 import pytest
 from decouple import config
 from mongoengine import connect
+from pymongo import MongoClient
 
 # noinspection PyUnresolvedReferences
 from immuni_common.helpers.tests import monitoring_setup  # noqa isort:skip
@@ -29,11 +30,17 @@ def _monitoring_files(directory: str) -> Iterable[str]:
     return (filename for filename in os.listdir(directory) if filename.endswith(".db"))
 
 
+@pytest.fixture(autouse=True, scope="session")
+def connect_db() -> Generator[MongoClient, None, None]:
+    # NOTE: One pooled client per test session (and per xdist worker); connecting inside every
+    #  test multiplied sockets for no isolation gain, since isolation comes from the drop below.
+    yield connect("test", maxPoolSize=10)
+
+
 @pytest.fixture(autouse=True, scope="function")
-def init_db() -> Generator[None, None, None]:
-    db = connect("test")
+def init_db(connect_db: MongoClient) -> Generator[None, None, None]:
     yield
-    db.drop_database("test")
+    connect_db.drop_database("test")
 
 
 REDIS_URL: str = config("REDIS_URL", default="redis://localhost:6379/0")
@@ -12,6 +12,7 @@
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Tuple
 
 from celery import Celery
@@ -67,13 +68,20 @@ def another_dummy_celery_task(local_celery_app: Celery, celery_worker: Worker) -
     return _another_dummy
 
 
+@lru_cache(maxsize=None)
+def _cached_crontab(hour: int, minute: int) -> crontab:
+    # NOTE: crontab parses its spec and builds per-field sets on every construction; the few
+    #  (hour, minute) pairs the tests use are built once.
+    return crontab(hour=hour, minute=minute)
+
+
 def _schedule_crontab(minute: int) -> crontab:
     """
     Schedule to avoid having a task running during the tests execution.
     :return: the
     """
     now_hour = datetime.utcnow().hour
-    return crontab(hour=1 if now_hour == 0 else (now_hour - 1), minute=minute)
+    return _cached_crontab(hour=1 if now_hour == 0 else (now_hour - 1), minute=minute)
 
 
 def test_celery_app_creation(local_celery_app: CeleryApp) -> None:
@@ -47,6 +47,11 @@ _COMMON_INVALID_FIELD_VALUES: Tuple[Any, ...] = (
     tuple(),
 )
 
+# The sized subset, filtered once instead of per parametrize expansion.
+_SIZED_INVALID_VALUES: Tuple[Any, ...] = tuple(
+    v for v in _COMMON_INVALID_FIELD_VALUES if hasattr(v, "__len__")
+)
+
 
 def test_otp_code_validator_odd_map() -> None:
     assert set(OtpCodeValidator._ODD_MAP.keys()) == set(OtpCodeValidator._ALPHABET)
@@ -56,12 +61,12 @@ def test_otp_code_validator_even_map() -> None:
     assert set(OtpCodeValidator._EVEN_MAP.keys()) == set(OtpCodeValidator._ALPHABET)
 
 
-@mark.parametrize("value", ("mock", ""))
-def test_base64_string_success(value: str) -> None:
-    bas64encoded = base64.b64encode(value.encode("utf-8"))
-
-    Base64String().validate(bas64encoded)  # type:ignore
-    Base64String(length=len(value)).validate(bas64encoded)  # type:ignore
+@mark.parametrize(
+    "value, encoded", (("mock", base64.b64encode(b"mock")), ("", base64.b64encode(b"")))
+)
+def test_base64_string_success(value: str, encoded: bytes) -> None:
+    Base64String().validate(encoded)  # type:ignore
+    Base64String(length=len(value)).validate(encoded)  # type:ignore
 
 
 @mark.parametrize(
@@ -111,20 +116,31 @@ def test_base64_string_length(value: str) -> None:
         "87S8QWH1EE",
         "527AZ66UHX",
         "b39e0733843b1b5d7c558f52f117a824dc41216e0c2bb671b3d79ba82105dd94",
-        generate_otp(),
     ),
 )
 def test_otp_code_success(otp: str) -> None:
     OtpCode().validate(otp)  # type:ignore
 
 
+def test_otp_code_success_generated() -> None:
+    OtpCode().validate(generate_otp())  # type:ignore
+
+
+@mark.parametrize("length", (2, 9, 11, 100))
+def test_otp_code_failure_generated_length(length: int) -> None:
+    with raises(ValidationError):
+        OtpCode().validate(generate_otp(length=length, skip_validation=True))  # type:ignore
+
+
 @mark.parametrize(
     "value",
     (
-        generate_otp(length=2, skip_validation=True),
-        generate_otp(length=9, skip_validation=True),
-        generate_otp(length=11, skip_validation=True),
-        generate_otp(length=100, skip_validation=True),
+        # NOTE: Literal wrong-length codes; generating them at parametrize time would run the
+        #  RNG and the validator during test collection.
+        "AE",
+        "A" * 9,
+        "A" * 11,
+        "A" * 100,
         "AEFHIJ1234",  # 10 chars, all allowed.
         "AEFHIJ123N",  # 10 chars, one not allowed, check digit (i.e., N).
         "NEFHIJ1234",  # 10 chars, one not allowed (i.e., N).
@@ -140,7 +156,7 @@ def test_otp_code_success(otp: str) -> None:
         "A6F3XQQ1YA",
         "HL2S4U3A6H",
         "b39e0733843b1b5d7c558f52f117a824dc41216e0c2bb671b3d79ba82105dd94784728afb",
-        *(v for v in _COMMON_INVALID_FIELD_VALUES if hasattr(v, "__len__")),
+        *_SIZED_INVALID_VALUES,
     ),
 )
 def test_otp_code_failure(value: str) -> None:
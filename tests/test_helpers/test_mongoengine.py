@@ -39,7 +39,8 @@ def test_enum_field() -> None:
     MyDocument(enum_field=MyEnum.SECOND_VALUE).save()
     MyDocument(enum_field=MyEnum.SECOND_VALUE).save()
 
-    assert MyDocument.objects.count() == 3
+    # NOTE: The unfiltered total; estimated_document_count skips the countDocuments aggregation.
+    assert MyDocument._get_collection().estimated_document_count() == 3
     assert MyDocument.objects.filter(enum_field=MyEnum.FIRST_VALUE).count() == 1
     assert MyDocument.objects.filter(enum_field=MyEnum.SECOND_VALUE).count() == 2
 
@@ -12,23 +12,23 @@
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import base64
-import random
+import os
 from datetime import datetime, timedelta
 from typing import List
 
 import pytest
-from freezegun import freeze_time
+from bson import ObjectId
 from mongoengine import get_db
 
 from immuni_common.models.enums import TransmissionRiskLevel
 from immuni_common.models.mongoengine.batch_file import BatchFile
 from immuni_common.models.mongoengine.temporary_exposure_key import TemporaryExposureKey
 
+_TEN_MINUTES_IN_SECONDS = 600
+
 
 def generate_random_key_data(size_bytes: int = 16) -> str:
-    return base64.b64encode(
-        bytes(bytearray(random.getrandbits(8) for _ in range(size_bytes)))
-    ).decode("utf-8")
+    return base64.b64encode(os.urandom(size_bytes)).decode("ascii")
 
 
 @pytest.fixture
@@ -37,28 +37,28 @@ def batch_files() -> List[BatchFile]:
     start_datetime = datetime.utcnow() - timedelta(days=num_batches - 1)
     batches = []
     for i in range(num_batches):
-        with freeze_time(start_datetime + timedelta(days=i)):
-            batches.append(
-                BatchFile(
-                    index=i + 1,
-                    keys=[
-                        TemporaryExposureKey(
-                            key_data=generate_random_key_data(),
-                            transmission_risk_level=TransmissionRiskLevel.CONFIRMED_TEST_HIGH,
-                            rolling_start_number=int(
-                                datetime.utcnow().timestamp()
-                                / timedelta(minutes=10).total_seconds()
-                            ),
-                            rolling_period=144,
-                        )
-                    ],
-                    period_start=datetime.utcnow() - timedelta(days=1),
-                    period_end=datetime.utcnow(),
-                    sub_batch_index=1,
-                    sub_batch_count=1,
-                ).save()
+        target = start_datetime + timedelta(days=i)
+        batches.append(
+            BatchFile(
+                # NOTE: Explicit ObjectIds, since delete_older_than filters on the creation time
+                #  the ObjectId embeds; this replaces freezing time around each save.
+                id=ObjectId.from_datetime(target),
+                index=i + 1,
+                keys=[
+                    TemporaryExposureKey(
+                        key_data=generate_random_key_data(),
+                        transmission_risk_level=TransmissionRiskLevel.CONFIRMED_TEST_HIGH,
+                        rolling_start_number=int(target.timestamp() / _TEN_MINUTES_IN_SECONDS),
+                        rolling_period=144,
+                    )
+                ],
+                period_start=target - timedelta(days=1),
+                period_end=target,
+                sub_batch_index=1,
+                sub_batch_count=1,
             )
-    return batches
+        )
+    return BatchFile.objects.insert(batches)
 
 
 def test_get_latest_info(batch_files: List[BatchFile]) -> None:
@@ -80,7 +80,8 @@ def test_from_index(batch_files: List[BatchFile]) -> None:
 
 def test_delete_old_batches(batch_files: List[BatchFile]) -> None:
     BatchFile.delete_older_than(datetime.utcnow() - timedelta(days=8, seconds=1))
-    assert BatchFile.objects.count() == 9
+    # NOTE: The unfiltered total; estimated_document_count skips the countDocuments aggregation.
+    assert BatchFile._get_collection().estimated_document_count() == 9
 
 
 def test_oldest_newest_batches(batch_files: List[BatchFile]) -> None:
@@ -12,23 +12,23 @@
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import base64
-import random
+import os
 from datetime import datetime, timedelta
 from typing import List
 
 import pytest
-from freezegun import freeze_time
+from bson import ObjectId
 from mongoengine import get_db
 
 from immuni_common.models.enums import TransmissionRiskLevel
 from immuni_common.models.mongoengine.batch_file_eu import BatchFileEu
 from immuni_common.models.mongoengine.temporary_exposure_key import TemporaryExposureKey
 
+_TEN_MINUTES_IN_SECONDS = 600
+
 
 def generate_random_key_data_eu(size_bytes: int = 16) -> str:
-    return base64.b64encode(
-        bytes(bytearray(random.getrandbits(8) for _ in range(size_bytes)))
-    ).decode("utf-8")
+    return base64.b64encode(os.urandom(size_bytes)).decode("ascii")
 
 
 @pytest.fixture
@@ -37,29 +37,29 @@ def batch_files_eu() -> List[BatchFileEu]:
     start_datetime = datetime.utcnow() - timedelta(days=num_batches - 1)
     batches = []
     for i in range(num_batches):
-        with freeze_time(start_datetime + timedelta(days=i)):
-            batches.append(
-                BatchFileEu(
-                    index=i + 1,
-                    keys=[
-                        TemporaryExposureKey(
-                            key_data=generate_random_key_data_eu(),
-                            transmission_risk_level=TransmissionRiskLevel.CONFIRMED_TEST_HIGH,
-                            rolling_start_number=int(
-                                datetime.utcnow().timestamp()
-                                / timedelta(minutes=10).total_seconds()
-                            ),
-                            rolling_period=144,
-                        )
-                    ],
-                    period_start=datetime.utcnow() - timedelta(days=1),
-                    period_end=datetime.utcnow(),
-                    sub_batch_index=1,
-                    sub_batch_count=1,
-                    origin="DK",
-                ).save()
+        target = start_datetime + timedelta(days=i)
+        batches.append(
+            BatchFileEu(
+                # NOTE: Explicit ObjectIds, since delete_older_than filters on the creation time
+                #  the ObjectId embeds; this replaces freezing time around each save.
+                id=ObjectId.from_datetime(target),
+                index=i + 1,
+                keys=[
+                    TemporaryExposureKey(
+                        key_data=generate_random_key_data_eu(),
+                        transmission_risk_level=TransmissionRiskLevel.CONFIRMED_TEST_HIGH,
+                        rolling_start_number=int(target.timestamp() / _TEN_MINUTES_IN_SECONDS),
+                        rolling_period=144,
+                    )
+                ],
+                period_start=target - timedelta(days=1),
+                period_end=target,
+                sub_batch_index=1,
+                sub_batch_count=1,
+                origin="DK",
             )
-    return batches
+        )
+    return BatchFileEu.objects.insert(batches)
 
 
 def test_get_latest_info_eu(batch_files_eu: List[BatchFileEu]) -> None:
@@ -81,7 +81,8 @@ def test_from_index_eu(batch_files_eu: List[BatchFileEu]) -> None:
 
 def test_delete_old_batches_eu(batch_files_eu: List[BatchFileEu]) -> None:
     BatchFileEu.delete_older_than(datetime.utcnow() - timedelta(days=8, seconds=1))
-    assert BatchFileEu.objects.count() == 9
+    # NOTE: The unfiltered total; estimated_document_count skips the countDocuments aggregation.
+    assert BatchFileEu._get_collection().estimated_document_count() == 9
 
 
 def test_oldest_newest_batches_eu(batch_files_eu: List[BatchFileEu]) -> None:
@@ -11,16 +11,17 @@
 #  You should have received a copy of the GNU Affero General Public License
 #  along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-import itertools
 import json
 import os
 from datetime import date, datetime
 from enum import Enum, auto
 from http import HTTPStatus
 from typing import Any, Dict
+from urllib.parse import urlencode
 
 from marshmallow import fields
 from marshmallow.fields import Field
+from marshmallow.validate import Range
 from pytest import mark, raises
 from pytest_sanic.utils import TestClient
 from sanic import Sanic
@@ -84,40 +85,32 @@ async def test_metrics_after_one_request(client: TestClient) -> None:
     assert "immuni_api_requests_latency_seconds_count" in actual
 
 
+# NOTE: Field instances can be shared across cases and locations; marshmallow deep-copies the
+#  declared fields when instantiating each schema.
+_STRING_REQUIRED = fields.String(required=True)
+_STRING_OPTIONAL = fields.String(required=False)
+_INT_REQUIRED = fields.Int(required=True, validate=Range(min=11))
+_INT_OPTIONAL = fields.Int(required=False, validate=Range(min=11))
+
+_VALIDATION_CASES = (
+    ({"test_string": _STRING_REQUIRED}, {"test_string": "test"}),
+    ({"test_string": _STRING_OPTIONAL}, {}),
+    (
+        {"test_string": _STRING_REQUIRED, "test_int": _INT_REQUIRED},
+        {"test_string": "test", "test_int": 11},
+    ),
+    ({"test_string": _STRING_REQUIRED, "test_int": _INT_OPTIONAL}, {"test_string": "test"}),
+    ({}, {}),
+)
+
+
 @mark.parametrize(
     "location,validation_fields,expected",
-    list(
-        itertools.chain.from_iterable(
-            [
-                [
-                    (
-                        location,
-                        {"test_string": fields.String(required=True)},
-                        {"test_string": "test"},
-                    ),
-                    (location, {"test_string": fields.String(required=False)}, {}),
-                    (
-                        location,
-                        {
-                            "test_string": fields.String(required=True),
-                            "test_int": fields.Int(required=True, validate=lambda x: x > 10),
-                        },
-                        {"test_string": "test", "test_int": 11},
-                    ),
-                    (
-                        location,
-                        {
-                            "test_string": fields.String(required=True),
-                            "test_int": fields.Int(required=False, validate=lambda x: x > 10),
-                        },
-                        {"test_string": "test"},
-                    ),
-                    (location, {}, {},),
-                ]
-                for location in Location
-            ]
-        ),
-    ),
+    [
+        (location, validation_fields, expected)
+        for location in Location
+        for validation_fields, expected in _VALIDATION_CASES
+    ],
 )
 async def test_validate_query_args(
     location: Location,
@@ -132,8 +125,7 @@ async def test_validate_query_args(
         return json_response(kwargs)
 
     if location == Location.QUERY:
-        query_string = "&".join([f"{k}={v}" for k, v in expected.items()])
-        response = await client.get(f"/validated?{query_string}")
+        response = await client.get(f"/validated?{urlencode(expected)}")
     elif location == Location.JSON:
         response = await client.get(
             "/validated", json=expected, headers={"content-type": "application/json; charset=utf-8"}